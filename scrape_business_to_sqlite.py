@@ -11,13 +11,26 @@ Usage:
     python scrape_moneycontrol_to_sqlite.py
 """
 
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+import httpx
+from aiolimiter import AsyncLimiter
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+from bs4 import BeautifulSoup, NavigableString, Tag
+import soupsieve
+import lxml.html
+import lxml.etree
 import sqlite3
-from urllib.parse import urljoin, urlparse
+import hashlib
 import time
+import threading
+import zstandard as zstd
+from urllib.parse import urljoin, urlparse
 import sys
 from dateutil import parser as dateparser
+from datetime import datetime
+from functools import lru_cache
 import re
 
 # ---------------------------
@@ -29,16 +42,92 @@ HEADERS = {
 }
 DB_PATH = "articles.db"
 TABLE_NAME = "business_articles"
-REQUEST_SLEEP = 0.8                                         # short delay between article requests
+MAX_CONCURRENCY = 10                                        # article requests in flight at once
+PARSE_WORKERS = os.cpu_count() or 1                         # parser processes / parser coroutines
+QUEUE_SIZE = 64                                             # bound on pages/records waiting between stages
+BATCH_SIZE = 64                                             # max articles per executemany
+BATCH_WAIT = 2.0                                            # seconds the writer waits to fill a batch
+CACHE_TABLE = "url_cache"                                   # ETag / Last-Modified per fetched URL
+NOT_MODIFIED = object()                                     # returned instead of a page on HTTP 304
+META_TABLE = "meta"                                         # key/value state kept between runs
+HOME_RECHECK_SECONDS = 3600                                 # re-scrape an identical homepage after this long
+INSERT_SQL = f"""
+    INSERT OR IGNORE INTO {TABLE_NAME} (title, author, publication_date, article_url, content)
+    VALUES (?, ?, ?, ?, ?)
+"""
+CACHE_UPSERT_SQL = f"INSERT OR REPLACE INTO {CACHE_TABLE} (url, etag, last_modified) VALUES (?, ?, ?)"
+MAX_ATTEMPTS = 5                                            # tries per URL on transient HTTP errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RATE_LIMIT = AsyncLimiter(5, 1)                             # at most 5 requests per second
+
+# absolute http(s) URL without query/fragment: group 1 = cleaned URL, 2 = netloc, 3 = path
+URL_RE = re.compile(r"^(https?://([^/?#]+)(/[^?#]*))")
+
+# selectors and patterns used by the article parser, compiled once
+BY_RE = re.compile(r"^By\s+", re.I)
+AUTHOR_SEL = soupsieve.compile(".author, .byline, .author-name, .article-author, a[rel='author']")
+DATE_SEL = soupsieve.compile(".date, .time, .publishing-date, .article-date")
+CONTENT_SELS = [                                            # possible locations of the article text
+    soupsieve.compile(sel)
+    for sel in (
+        "div.articleText",
+        "div.articleContent",
+        "div.article-desc",
+        "div#content",
+        "div#articleBody",
+        "article"
+    )
+]
+
+HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+# article content is stored as a zstd-compressed UTF-8 BLOB
+CCTX = zstd.ZstdCompressor(level=3)
+DCTX = zstd.ZstdDecompressor()
 
 
 # ---------------------------
 # Database setup helpers
 # ---------------------------
+_db = None                                                  # shared connection, opened by get_db()
+DB_LOCK = threading.Lock()                                  # serialises writes on the shared connection
+
+
+def connect_db():
+    """Open a connection tuned for bulk writes (these PRAGMAs are per-connection)."""
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn.execute("PRAGMA synchronous=NORMAL")                # safe with WAL, skips fsync per commit
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")                 # ~64 MB page cache
+    conn.execute("PRAGMA mmap_size=268435456")               # 256 MB memory-mapped I/O
+    return conn
+
+
+def get_db():
+    """Return the long-lived connection reused by every DB helper, opening it on first use.
+
+    Reusing one connection also reuses sqlite3's cache of prepared statements.
+    """
+    global _db
+    if _db is None:
+        _db = connect_db()
+    return _db
+
+
+def close_db():
+    """Close the shared connection if it is open."""
+    global _db
+    if _db is not None:
+        _db.close()
+        _db = None
+
+
 def create_db():
     """Create the SQLite DB and table if not already present."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_db()
     cur = conn.cursor()
+    # WAL is stored in the DB file, so setting it once here sticks for later connections
+    cur.execute("PRAGMA journal_mode=WAL")
     cur.execute(f"""
         CREATE TABLE IF NOT EXISTS {TABLE_NAME} (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -46,62 +135,225 @@ def create_db():
             author TEXT,
             publication_date TEXT,
             article_url TEXT UNIQUE,
-            content TEXT
+            content BLOB
+        )
+    """)
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS {CACHE_TABLE} (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT
+        )
+    """)
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS {META_TABLE} (
+            key TEXT PRIMARY KEY,
+            value TEXT
         )
     """)
     conn.commit()
-    conn.close()
 
-# save article to database
-def save_article_to_db(article):
-    """Insert a single article into the SQLite database."""
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
+def load_saved_urls():
+    """Return the set of article URLs already stored in the database."""
+    return {row[0] for row in get_db().execute(f"SELECT article_url FROM {TABLE_NAME}")}
+
+# HTTP validator cache helpers
+def load_url_cache():
+    """Return {url: (etag, last_modified)} for every URL fetched on earlier runs."""
+    return {
+        url: (etag, last_modified)
+        for url, etag, last_modified in get_db().execute(
+            f"SELECT url, etag, last_modified FROM {CACHE_TABLE}"
+        )
+    }
+
+
+def url_cache_rows(cache, urls):
+    """Return (url, etag, last_modified) rows for the given URLs that have validators."""
+    return [(u, *cache[u]) for u in urls if u in cache and any(cache[u])]
+
+
+def save_url_cache(cache, urls):
+    """Persist the cached validators of the given URLs."""
+    rows = url_cache_rows(cache, urls)
+    if not rows:
+        return
+    conn = get_db()
+    with DB_LOCK, conn:
+        conn.executemany(CACHE_UPSERT_SQL, rows)
+
+
+# homepage change detection helpers
+def homepage_unchanged(home_hash):
+    """True if the last successful run saw the same homepage less than HOME_RECHECK_SECONDS ago."""
+    meta = dict(get_db().execute(
+        f"SELECT key, value FROM {META_TABLE} WHERE key IN ('home_hash', 'last_run')"
+    ))
+    if meta.get("home_hash") != home_hash:
+        return False
+    return time.time() - float(meta.get("last_run", 0)) < HOME_RECHECK_SECONDS
+
+
+def mark_homepage_done(cache, home_url, home_hash):
+    """Record the homepage as fully scraped: its HTTP validators, content hash and run time."""
+    save_url_cache(cache, [home_url])
+    conn = get_db()
+    with DB_LOCK, conn:
+        conn.executemany(
+            f"INSERT OR REPLACE INTO {META_TABLE} (key, value) VALUES (?, ?)",
+            [("home_hash", home_hash), ("last_run", str(time.time()))]
+        )
+
+
+def conditional_headers(cache, url):
+    """Build If-None-Match / If-Modified-Since headers from the cached validators of url."""
+    headers = {}
+    etag, last_modified = (cache or {}).get(url, (None, None))
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+# content (de)compression
+def compress_content(text):
+    """Compress article text for storage; empty text is stored as-is."""
+    return CCTX.compress(text.encode("utf-8")) if text else text
+
+
+def decompress_content(value):
+    """Return article text from a stored content value (older rows hold plain TEXT)."""
+    if isinstance(value, bytes):
+        return DCTX.decompress(value).decode("utf-8")
+    return value or ""
+
+# save articles to database
+def save_articles_bulk(articles, cache=None, urls=()):
+    """Insert many articles in one transaction; duplicate URLs are ignored.
+
+    Validators of urls (from cache) are written in the same transaction, so they
+    are only kept if the articles are. Returns False if the write failed.
+    """
+    rows = [
+        (
+            a.get("title"),
+            a.get("author"),
+            a.get("publication_date"),
+            a.get("article_url"),
+            compress_content(a.get("content"))
+        )
+        for a in articles
+    ]
+    cache_rows = url_cache_rows(cache, urls) if cache else []
+    if not rows and not cache_rows:
+        return True
+    conn = get_db()
     try:
-        cur.execute(f"""
-            INSERT INTO {TABLE_NAME} (title, author, publication_date, article_url, content)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
-            article.get("title"),
-            article.get("author"),
-            article.get("publication_date"),
-            article.get("article_url"),
-            article.get("content")
-        ))
-        conn.commit()
-        print(f"[DB] Saved: {article.get('title')[:60]}")
-    except sqlite3.IntegrityError:
-        # this happens if the article URL already exists
-        print(f"[DB] Skipped (duplicate): {article.get('article_url')}")
+        with DB_LOCK, conn:
+            before = conn.total_changes
+            conn.executemany(INSERT_SQL, rows)
+            saved = conn.total_changes - before
+            conn.executemany(CACHE_UPSERT_SQL, cache_rows)
+        if rows:
+            print(f"[DB] Saved {saved} articles, skipped {len(rows) - saved} duplicates.")
+        return True
     except Exception as e:
-        print(f"[DB] Error saving article: {e}")
-    finally:
-        conn.close()
+        print(f"[DB] Error saving articles: {e}")
+        return False
 
 
-# HTTP utilities to get BeautifulSoup objects
+# HTTP utilities to get pages and BeautifulSoup objects
 
-def get_soup(url):
-    """Fetch a webpage and return a BeautifulSoup object."""
-    try:
-        response = requests.get(url, headers=HEADERS, timeout=12)
+def make_client():
+    """Create the shared HTTP/2 client; requests to one host multiplex over one TLS connection."""
+    return httpx.AsyncClient(
+        headers=HEADERS,
+        timeout=12.0,
+        follow_redirects=True,
+        transport=httpx.AsyncHTTPTransport(http2=True, limits=HTTP_LIMITS)
+    )
+
+
+def is_transient(exc):
+    """True for errors worth retrying: network failures and 429/5xx responses."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRY_STATUSES
+    return isinstance(exc, httpx.TransportError)
+
+
+_backoff = wait_random_exponential(multiplier=0.5, max=30)
+
+
+def retry_wait(retry_state):
+    """Wait as long as the server's Retry-After asks, else back off exponentially."""
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, httpx.HTTPStatusError):
+        retry_after = exc.response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(int(retry_after), 60)
+    return _backoff(retry_state)
+
+
+@retry(
+    retry=retry_if_exception(is_transient),
+    wait=retry_wait,
+    stop=stop_after_attempt(MAX_ATTEMPTS),
+    reraise=True
+)
+async def request_page(client, url, headers):
+    """GET a URL under the rate limit, raising for error statuses so they can be retried."""
+    async with RATE_LIMIT:
+        response = await client.get(url, headers=headers)
+    if response.status_code != 304:
         response.raise_for_status()
-        return BeautifulSoup(response.text, "html.parser")
+    return response
+
+
+async def get_page(client, url, cache=None):
+    """Fetch a webpage and return its raw HTML bytes, or None on failure.
+
+    When a url cache is given, the request is made conditional: NOT_MODIFIED is
+    returned on HTTP 304, otherwise the new validators are stored in the cache.
+    """
+    try:
+        response = await request_page(client, url, conditional_headers(cache, url))
+        if response.status_code == 304:
+            return NOT_MODIFIED
+        if cache is not None:
+            cache[url] = (response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        # raw bytes let lxml detect the encoding itself instead of decoding twice
+        return response.content
     except Exception as e:
         print(f"[HTTP] Failed to fetch {url}: {e}")
         return None
 
+def article_soup(html):
+    """Build the BeautifulSoup of an article page for parse_moneycontrol."""
+    return BeautifulSoup(html, "lxml")
+
+
+def warm_up_parser():
+    """Process-pool initializer: load lxml/bs4 before the first real page arrives."""
+    article_soup(b"<html><body><p>warm-up</p></body></html>")
+
 # date parsing function
 
+@lru_cache(maxsize=4096)
 def parse_iso_datetime(text):
     """Try to parse any date string and return it in ISO format."""
     if not text:
         return None
+    text = text.strip()
+    try:
+        # meta/time tags are nearly always ISO 8601 already: take the C fast path first
+        return datetime.fromisoformat(text).isoformat()
+    except ValueError:
+        pass
     try:
         dt = dateparser.parse(text)
         return dt.isoformat()
     except Exception:
-        return text.strip()
+        return text
 
 # text extraction helper
 def extract_text_from_elements(elements):
@@ -114,6 +366,48 @@ def extract_text_from_elements(elements):
     return "\n\n".join(chunks).strip()
 
 
+def extract_block_text(node):
+    r"""Extract node's text in one pass: a space within a block, a blank line at p/div/br boundaries.
+
+    Text sitting directly in an outer block is kept and nested blocks are not repeated:
+
+    >>> html = '<div><div>Intro sentence.<p>Para one.</p></div><p>Para two.</p></div>'
+    >>> extract_block_text(BeautifulSoup(html, "lxml").div)
+    'Intro sentence.\n\nPara one.\n\nPara two.'
+    """
+    chunks = []
+    words = []
+    current = None
+    block_of = {}                                           # id(tag) -> its nearest p/div (or node)
+    for el in node.descendants:
+        if isinstance(el, Tag):
+            if el.name == "br":
+                current = el                                # next string starts a new chunk
+            continue
+        # plain text only: comments, script/style bodies etc. are subclasses, as in get_text()
+        if type(el) is not NavigableString:
+            continue
+        text = el.strip()
+        if not text:
+            continue
+        parent = el.parent
+        block = block_of.get(id(parent))
+        if block is None:
+            block = parent
+            while block is not node and block.name not in ("p", "div"):
+                block = block.parent
+            block_of[id(parent)] = block
+        if block is not current:
+            if words:
+                chunks.append(" ".join(words))
+                words = []
+            current = block
+        words.append(text)
+    if words:
+        chunks.append(" ".join(words))
+    return "\n\n".join(chunks)
+
+
 # Main parser for Moneycontrol articles
 
 def parse_moneycontrol(url, soup):
@@ -140,12 +434,12 @@ def parse_moneycontrol(url, soup):
     if meta_author and meta_author.get("content"):
         out["author"] = meta_author["content"].strip()
     else:
-        author_sel = soup.select_one(".author, .byline, .author-name, .article-author, a[rel='author']")
+        author_sel = AUTHOR_SEL.select_one(soup)
         if author_sel:
             out["author"] = author_sel.get_text(separator=" ", strip=True)
         else:
             # sometimes it's plain text starting with "By ..."
-            by_text = soup.find(string=re.compile(r"^By\s+", re.I))
+            by_text = soup.find(string=BY_RE)
             if by_text and by_text.parent:
                 out["author"] = by_text.parent.get_text(separator=" ", strip=True)
 
@@ -159,25 +453,16 @@ def parse_moneycontrol(url, soup):
             dt = time_tag.get("datetime") or time_tag.get_text()
             out["publication_date"] = parse_iso_datetime(dt)
         else:
-            date_el = soup.select_one(".date, .time, .publishing-date, .article-date")
+            date_el = DATE_SEL.select_one(soup)
             if date_el:
                 out["publication_date"] = parse_iso_datetime(date_el.get_text())
 
     # Possible locations where article text appears
-    content_selectors = [
-        "div.articleText",
-        "div.articleContent",
-        "div.article-desc",
-        "div#content",
-        "div#articleBody",
-        "article"
-    ]
     content = None
-    for sel in content_selectors:
-        node = soup.select_one(sel)
+    for sel in CONTENT_SELS:
+        node = sel.select_one(soup)
         if node:
-            paragraphs = node.find_all(["p", "div"], recursive=True)
-            content = extract_text_from_elements(paragraphs)
+            content = extract_block_text(node)
             if content:
                 break
 
@@ -194,67 +479,246 @@ def parse_moneycontrol(url, soup):
     return out
 
 
+def parse_article_html(url, html):
+    """Parse raw article HTML; takes plain bytes so it can run in a worker process."""
+    return parse_moneycontrol(url, article_soup(html))
+
+
 # Collect Business article links from homepage
 
-def collect_business_links(home_url, homepage_soup):
-    """Find and return all same-site /business/ article links from homepage."""
+def collect_business_links(home_url, homepage_html):
+    """Find and return all same-site /business/ article links from homepage HTML."""
     parsed_home = urlparse(home_url)
     base_netloc = parsed_home.netloc
     links = set()
 
-    for a in homepage_soup.find_all("a", href=True):
-        href = a["href"].strip()
-        abs_url = urljoin(home_url, href)
-        parsed = urlparse(abs_url)
+    # plain lxml tree: only <a href> values are needed, so skip building a BeautifulSoup
+    # and let a C-level XPath pick them out instead of walking every link attribute
+    try:
+        hrefs = lxml.html.fromstring(homepage_html).xpath("//a/@href")
+    except lxml.etree.ParserError as e:
+        # e.g. a 200 response holding only whitespace or comments
+        print(f"[ERROR] Could not parse homepage HTML: {e}")
+        return links
+
+    for href in hrefs:
+        abs_url = urljoin(home_url, href.strip())
+        # one regex match instead of urlparse() + split() for every anchor on the page
+        m = URL_RE.match(abs_url)
+        if not m:
+            continue
+        cleaned, netloc, path = m.groups()
 
         # skip external domains
-        if parsed.netloc != base_netloc:
+        if netloc != base_netloc:
             continue
 
         # only keep URLs containing '/business/'
-        if "/business/" in parsed.path:
-            cleaned = abs_url.split("#")[0].split("?")[0]
+        if "/business/" in path:
             links.add(cleaned)
 
     return links
 
 
+# Async article pipeline: fetchers -> parsers -> DB writer, joined by bounded queues
+# so network, CPU and disk work overlap; a None on a queue tells its consumer to stop.
+
+async def fetch_worker(client, url_q, html_q, cache):
+    """Fetch queued URLs and pass their HTML on; returns (not modified, failed) counts."""
+    unchanged = failed = 0
+    while (url := await url_q.get()) is not None:
+        html = await get_page(client, url, cache)
+        if html is NOT_MODIFIED:
+            unchanged += 1
+        elif html is None:
+            failed += 1
+        else:
+            await html_q.put((url, html))
+    return unchanged, failed
+
+
+async def parse_worker(pool, html_q, rec_q):
+    """Parse queued pages in the process pool and pass the article dicts on; returns failures."""
+    loop = asyncio.get_running_loop()
+    failed = 0
+    while (item := await html_q.get()) is not None:
+        url, html = item
+        try:
+            article = await loop.run_in_executor(pool, parse_article_html, url, html)
+        except Exception as e:
+            print(f"[ERROR] Failed to parse {url}: {e}")
+            failed += 1
+            continue
+        await rec_q.put(article)
+    return failed
+
+
+async def write_batch(batch, cache):
+    """Save one batch of parsed pages off the event loop; False if any write failed.
+
+    Never raises, so the writer keeps draining its queue even when the DB is locked.
+    """
+    articles = []
+    for article in batch:
+        if not article.get("title") and not article.get("content"):
+            print(f"[WARN] No title/content found — probably not a news article: {article['article_url']}")
+            continue
+        articles.append(article)
+    # validators go in the same transaction as the rows, so failed pages get refetched
+    urls = [a["article_url"] for a in batch]
+    try:
+        return await asyncio.to_thread(save_articles_bulk, articles, cache, urls)
+    except Exception as e:
+        print(f"[DB] Error saving batch: {e}")
+        return False
+
+
+async def db_writer(rec_q, cache):
+    """Write parsed articles in batches of up to BATCH_SIZE.
+
+    After the first article of a batch arrives, the writer keeps collecting for up
+    to BATCH_WAIT seconds so executemany gets many rows per commit.
+    Returns False if any batch failed to save.
+    """
+    loop = asyncio.get_running_loop()
+    ok = True
+    done = False
+    while not done:
+        article = await rec_q.get()
+        if article is None:
+            break
+        batch = [article]
+        deadline = loop.time() + BATCH_WAIT
+        while len(batch) < BATCH_SIZE and loop.time() < deadline:
+            if rec_q.empty():
+                # poll rather than wait_for(get()) so a timed-out get can never lose an item
+                await asyncio.sleep(0.05)
+                continue
+            article = rec_q.get_nowait()
+            if article is None:
+                done = True
+                break
+            batch.append(article)
+        ok = await write_batch(batch, cache) and ok
+    return ok
+
+
+async def close_stages(fetchers, parsers, html_q, rec_q):
+    """Send stop sentinels down the pipeline as each upstream stage finishes.
+
+    Returns (not modified count, fetch + parse failure count).
+    """
+    fetch_counts = await asyncio.gather(*fetchers)
+    for _ in parsers:
+        await html_q.put(None)
+    parse_failures = await asyncio.gather(*parsers)
+    await rec_q.put(None)
+    unchanged = sum(u for u, _ in fetch_counts)
+    failed = sum(f for _, f in fetch_counts) + sum(parse_failures)
+    return unchanged, failed
+
+
+async def scrape_articles(client, pool, links, cache):
+    """Run the fetch/parse/write pipeline over links.
+
+    Returns (not-modified count, complete), where complete means every link was
+    fetched, parsed and saved without error.
+    """
+    url_q = asyncio.Queue()
+    html_q = asyncio.Queue(QUEUE_SIZE)
+    rec_q = asyncio.Queue(QUEUE_SIZE)
+    for url in links:
+        url_q.put_nowait(url)
+    for _ in range(MAX_CONCURRENCY):
+        url_q.put_nowait(None)
+
+    fetchers = [asyncio.create_task(fetch_worker(client, url_q, html_q, cache)) for _ in range(MAX_CONCURRENCY)]
+    parsers = [asyncio.create_task(parse_worker(pool, html_q, rec_q)) for _ in range(PARSE_WORKERS)]
+    writer = asyncio.create_task(db_writer(rec_q, cache))
+
+    closer = asyncio.create_task(close_stages(fetchers, parsers, html_q, rec_q))
+
+    done, pending = await asyncio.wait({closer, writer}, return_when=asyncio.FIRST_EXCEPTION)
+    if pending:
+        # one side crashed: stop the rest instead of blocking on a queue nobody drains
+        for task in [*pending, *fetchers, *parsers]:
+            task.cancel()
+        await asyncio.gather(*pending, *fetchers, *parsers, return_exceptions=True)
+        error = next(t.exception() for t in done if t.exception())
+        print(f"[ERROR] Article pipeline stopped: {error!r}")
+        return 0, False
+    unchanged, failed = closer.result()
+    if failed:
+        print(f"[WARN] {failed} articles failed to fetch or parse.")
+    return unchanged, writer.result() and not failed
+
+
 # Main scraping workflow
 def scrape_moneycontrol():
     home_url = "https://www.moneycontrol.com/"
     print(f"[INFO] Fetching homepage: {home_url}")
 
-    homepage_soup = get_soup(home_url)
-    if not homepage_soup:
+    try:
+        asyncio.run(_scrape(home_url))
+    finally:
+        close_db()
+
+
+async def _scrape(home_url):
+    create_db()
+    cache = load_url_cache()
+    # parsing is CPU-bound and GIL-bound, so it runs in worker processes
+    with ProcessPoolExecutor(max_workers=PARSE_WORKERS, initializer=warm_up_parser) as pool:
+        async with make_client() as client:
+            await _scrape_with(client, pool, home_url, cache)
+
+
+async def _scrape_with(client, pool, home_url, cache):
+    homepage = await get_page(client, home_url, cache)
+    if homepage is NOT_MODIFIED:
+        print("[INFO] Homepage not modified since last run, nothing new to scrape.")
+        return
+    if not homepage:
         print("[ERROR] Failed to load Moneycontrol homepage.")
         return
 
-    links = collect_business_links(home_url, homepage_soup)
+    # servers that ignore conditional requests still get caught by a local content hash
+    home_hash = hashlib.blake2b(homepage, digest_size=8).hexdigest()
+    if homepage_unchanged(home_hash):
+        print("[INFO] Homepage unchanged since last run, skipping.")
+        return
+
+    links = collect_business_links(home_url, homepage)
     print(f"[INFO] Found {len(links)} Business links (filtered by '/business/').")
 
     if not links:
         print("[INFO] No Business section links found, exiting.")
         return
 
-    create_db()
+    # already-stored articles would only be ignored on insert, so don't fetch them at all
+    saved = load_saved_urls()
+    new_links = links - saved
+    if len(new_links) < len(links):
+        print(f"[INFO] Skipping {len(links) - len(new_links)} links already in the database.")
+    links = new_links
+    if not links:
+        print("[INFO] No new Business links to scrape.")
+        mark_homepage_done(cache, home_url, home_hash)
+        return
 
-    for idx, link in enumerate(sorted(links)):
-        print(f"\n[SCRAPE] ({idx + 1}/{len(links)}) {link}")
-        soup = get_soup(link)
-        if not soup:
-            print("[WARN] Couldnt fetch page, skipping.")
-            continue
+    links = sorted(links)
+    print(f"[SCRAPE] Fetching {len(links)} articles ({MAX_CONCURRENCY} at a time)...")
+    unchanged, complete = await scrape_articles(client, pool, links, cache)
 
-        try:
-            article = parse_moneycontrol(link, soup)
-            if not article.get("title") and not article.get("content"):
-                print("[WARN] No title/content found — probably not a news article.")
-                continue
-            save_article_to_db(article)
-        except Exception as e:
-            print(f"[ERROR] Failed to parse {link}: {e}")
+    if unchanged:
+        print(f"[INFO] Skipped {unchanged} articles not modified since last run.")
 
-        time.sleep(REQUEST_SLEEP)
+    # the homepage only counts as handled once every article was fetched, parsed and saved;
+    # otherwise it is rescraped next run so the failed links get retried
+    if complete:
+        mark_homepage_done(cache, home_url, home_hash)
+    else:
+        print("[INFO] Some articles failed; the homepage will be rescanned on the next run.")
 
 # call the main function
 if __name__ == "__main__":
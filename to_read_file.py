@@ -7,14 +7,20 @@ conn.close()
 '''
 
 import sqlite3
+import sys
 
 conn = sqlite3.connect("articles.db")
-cur = conn.cursor()
+conn.row_factory = sqlite3.Row
+conn.execute("PRAGMA mmap_size=268435456")
 
-cur.execute("SELECT id, title, author, publication_date, article_url FROM business_articles LIMIT 20")
-rows = cur.fetchall()
-
-for r in rows:
-    print(f"ID: {r[0]}\nTitle: {r[1]}\nAuthor: {r[2]}\nDate: {r[3]}\nURL: {r[4]}\n{'-'*80}")
+# stream rows straight off the cursor and write output in chunks instead of fetchall() + print per row
+buf = []
+for r in conn.execute("SELECT id, title, author, publication_date, article_url FROM business_articles LIMIT 20"):
+    buf.append(f"ID: {r['id']}\nTitle: {r['title']}\nAuthor: {r['author']}\n"
+               f"Date: {r['publication_date']}\nURL: {r['article_url']}\n{'-'*80}\n")
+    if len(buf) >= 1000:
+        sys.stdout.write("".join(buf))
+        buf.clear()
+sys.stdout.write("".join(buf))
 
 conn.close()